@@ -1,24 +1,44 @@
 import os
+import time
 import logging
+from contextlib import contextmanager
 from flask import Flask
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.exc import SQLAlchemyError
 
+# "full" keeps the development behaviour; "fast" is meant for pre-forked workers
+STARTUP_MODE = os.environ.get("STARTUP_MODE", "full").lower()
+FAST_STARTUP = STARTUP_MODE == "fast"
+
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO if FAST_STARTUP else logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-# Enable debug logging for SQLAlchemy
-logging.getLogger('sqlalchemy.engine').setLevel(logging.DEBUG)
+if not FAST_STARTUP:
+    # Enable debug logging for SQLAlchemy
+    logging.getLogger('sqlalchemy.engine').setLevel(logging.DEBUG)
 
 class Base(DeclarativeBase):
     pass
 
+@contextmanager
+def _phase(timings, name):
+    """Record how long a startup phase takes, in seconds"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
 def create_app():
+    timings = {}
+    startup_start = time.perf_counter()
+
     # Create the Flask application
-    app = Flask(__name__)
+    with _phase(timings, "flask"):
+        app = Flask(__name__)
     
     # Configure the database
     app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
@@ -30,19 +50,28 @@ def create_app():
     }
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.secret_key = os.environ.get("FLASK_SECRET_KEY", "dev_key_only")
-    app.debug = True  # Enable debug mode
+    app.debug = not FAST_STARTUP  # Enable debug mode outside fast startup
     
     # Initialize the database
-    from extensions import db
-    db.init_app(app)
+    with _phase(timings, "db_init"):
+        from extensions import db
+        db.init_app(app)
     
     with app.app_context():
-        import models
-        import routes
+        with _phase(timings, "models"):
+            import models
+        with _phase(timings, "routes"):
+            import routes
         
         try:
-            db.create_all()
-            logger.info("Database tables created successfully")
+            with _phase(timings, "schema"):
+                if FAST_STARTUP:
+                    # One cached version lookup instead of reflecting every table
+                    from utils.schema import ensure_schema
+                    ensure_schema()
+                else:
+                    db.create_all()
+                    logger.info("Database tables created successfully")
         except SQLAlchemyError as e:
             logger.error(f"Database initialization error: {str(e)}")
             raise
@@ -51,12 +80,16 @@ def create_app():
             raise
         
         # Register blueprints
-        from routes import inventory_bp
-        app.register_blueprint(inventory_bp)
+        with _phase(timings, "blueprints"):
+            from routes import inventory_bp
+            app.register_blueprint(inventory_bp)
     
+    timings["total"] = time.perf_counter() - startup_start
+    app.config["STARTUP_TIMINGS"] = timings
+    logger.info(f"Application started in {timings['total']:.3f}s ({STARTUP_MODE} mode)")
     return app
 
 # Create and run the application
 if __name__ == "__main__":
     app = create_app()
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=5000, debug=not FAST_STARTUP)
\ No newline at end of file
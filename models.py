@@ -70,3 +70,8 @@ class PartDetailsCache(db.Model):
     datasheet_url = db.Column(db.Text)
     last_updated = db.Column(db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     component = db.relationship('Component', backref='details_cache')
+
+class SchemaVersion(db.Model):
+    __tablename__ = 'schema_version'
+    version = db.Column(db.String(64), primary_key=True)
+    applied_at = db.Column(db.DateTime(timezone=True), default=datetime.utcnow)
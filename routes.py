@@ -3,7 +3,6 @@ from flask import Blueprint, render_template, request, jsonify, flash, redirect,
 from sqlalchemy import func, case, text
 from sqlalchemy.exc import SQLAlchemyError
 from models import db, Component, Supplier, Location, InventoryTransaction
-from utils.csv_import import process_csv_file
 import logging
 
 inventory_bp = Blueprint('inventory', __name__)
@@ -34,6 +33,8 @@ def import_csv():
             return jsonify({'error': 'No file selected'}), 400
             
         try:
+            # Imported here so pandas only loads when an import is requested
+            from utils.csv_import import process_csv_file
             results = process_csv_file(file)
             return jsonify({
                 'success': True,
@@ -48,7 +49,7 @@ def import_csv():
 @inventory_bp.route('/api/import/status')
 def import_status():
     """Get the current import status"""
-    from utils.csv_import import get_import_status
+    from utils.import_status import get_import_status
     return jsonify(get_import_status())
 
 @inventory_bp.route('/transactions')
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import inspect, text
+
+from extensions import db
+from models import Component, SchemaVersion
+from utils import schema
+from utils.schema import ensure_schema, get_stored_version, schema_fingerprint
+
+
+def test_fingerprint_is_stable():
+    assert schema_fingerprint() == schema_fingerprint()
+
+
+def test_fingerprint_changes_with_column(monkeypatch):
+    before = schema_fingerprint()
+    monkeypatch.setattr(Component.__table__.c.description, "nullable", False)
+    assert schema_fingerprint() != before
+
+
+def test_fingerprint_ignores_schema_version_table(monkeypatch):
+    before = schema_fingerprint()
+    monkeypatch.setattr(SchemaVersion.__table__.c.applied_at, "nullable", False)
+    assert schema_fingerprint() == before
+
+
+def test_fresh_database_creates_tables_and_records_version(app):
+    assert get_stored_version() is None
+
+    assert ensure_schema() is True
+
+    assert "components" in inspect(db.engine).get_table_names()
+    assert get_stored_version() == schema_fingerprint()
+
+
+def test_matching_version_skips_create_all(app, monkeypatch):
+    ensure_schema()
+
+    def fail():
+        raise AssertionError("create_all should not run")
+
+    monkeypatch.setattr(db, "create_all", fail)
+    assert ensure_schema() is False
+
+
+def test_stale_version_with_matching_tables_is_updated(app):
+    db.create_all()
+    db.session.add(SchemaVersion(version="stale"))
+    db.session.commit()
+
+    assert ensure_schema() is True
+    assert get_stored_version() == schema_fingerprint()
+
+
+def test_stale_version_with_drifted_columns_raises(app):
+    db.create_all()
+    db.session.execute(text("ALTER TABLE inventory_transactions DROP COLUMN notes"))
+    db.session.add(SchemaVersion(version="stale"))
+    db.session.commit()
+
+    with pytest.raises(RuntimeError, match="inventory_transactions.notes: column is missing"):
+        ensure_schema()
+    db.session.rollback()
+    assert get_stored_version() == "stale"
+
+
+def test_no_drift_after_create_all(app):
+    db.create_all()
+    assert schema.find_schema_drift() == []
@@ -0,0 +1,80 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.startup_profile import PROJECT_ROOT, parse_importtime, time_to_first_request
+
+# Boots the app twice in fast mode; create_all must not run on the second boot
+FAST_BOOT_SNIPPET = """
+import json, logging, sys
+import app
+from extensions import db
+
+first = app.create_app()
+
+def fail():
+    raise AssertionError("create_all ran on a boot with a matching schema version")
+
+db.create_all = fail
+second = app.create_app()
+print(json.dumps({
+    'timings': sorted(second.config['STARTUP_TIMINGS']),
+    'debug': second.debug,
+    'root_level': logging.getLogger().level,
+    'engine_level': logging.getLogger('sqlalchemy.engine').level,
+    'pandas': 'pandas' in sys.modules,
+}))
+"""
+
+
+@pytest.fixture
+def fast_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("STARTUP_MODE", "fast")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'inventory.db'}")
+    return dict(os.environ)
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   _io",
+        "import time:      2500 |      48000 | pandas",
+        "some unrelated line",
+    ])
+    assert parse_importtime(stderr) == [("_io", 120, 120), ("pandas", 2500, 48000)]
+
+
+def test_routes_do_not_import_pandas():
+    # Fresh interpreter so modules imported by other tests don't leak in
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, routes; print('pandas' in sys.modules)"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_fast_startup_uses_schema_version(fast_env):
+    result = subprocess.run(
+        [sys.executable, "-c", FAST_BOOT_SNIPPET],
+        cwd=PROJECT_ROOT, env=fast_env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    boot = json.loads(result.stdout.strip().splitlines()[-1])
+    assert boot["timings"] == sorted(
+        ["flask", "db_init", "models", "routes", "schema", "blueprints", "total"]
+    )
+    assert boot["debug"] is False
+    assert boot["root_level"] == logging.INFO
+    assert boot["engine_level"] == logging.NOTSET
+    assert boot["pandas"] is False
+
+
+def test_time_to_first_request_fast(fast_env):
+    assert time_to_first_request("fast", "/", timeout=30) > 0
+    # Error responses still count as the first served request
+    assert time_to_first_request("fast", "/nonexistent", timeout=30) > 0
@@ -1,26 +1,12 @@
 import pandas as pd
 from models import db, Component, Supplier, Location
+from utils.import_status import current_import_status, schedule_status_reset
 import logging
 
 logger = logging.getLogger(__name__)
 
-import threading
-
-# Global variable to track import progress
-current_import_status = {
-    'total_rows': 0,
-    'current_row': 0,
-    'status': 'idle',
-    'message': ''
-}
-
-def get_import_status():
-    """Get the current import status"""
-    return current_import_status
-
 def process_csv_file(file):
     """Process and validate CSV file for import"""
-    global current_import_status
     try:
         current_import_status['status'] = 'reading'
         current_import_status['message'] = 'Reading CSV file...'
@@ -111,16 +97,7 @@ def process_csv_file(file):
         })
         raise
     finally:
-        # Reset status after a delay to handle final status check
-        def reset_status():
-            global current_import_status
-            current_import_status = {
-                'total_rows': 0,
-                'current_row': 0,
-                'status': 'idle',
-                'message': ''
-            }
-        threading.Timer(5.0, reset_status).start()
+        schedule_status_reset()
 
 def clean_data(df):
     """Clean and standardize CSV data"""
@@ -0,0 +1,26 @@
+import threading
+
+# Global variable to track import progress
+current_import_status = {
+    'total_rows': 0,
+    'current_row': 0,
+    'status': 'idle',
+    'message': ''
+}
+
+def get_import_status():
+    """Get the current import status"""
+    return current_import_status
+
+def reset_import_status():
+    """Put the import status back to idle"""
+    current_import_status.update({
+        'total_rows': 0,
+        'current_row': 0,
+        'status': 'idle',
+        'message': ''
+    })
+
+def schedule_status_reset(delay=5.0):
+    """Reset status after a delay to handle final status check"""
+    threading.Timer(delay, reset_import_status).start()
@@ -0,0 +1,90 @@
+import hashlib
+import logging
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from models import db, SchemaVersion
+
+logger = logging.getLogger(__name__)
+
+def schema_fingerprint():
+    """Build a version string from the model metadata so it changes whenever the models do"""
+    parts = []
+    for table in sorted(db.metadata.tables.values(), key=lambda t: t.name):
+        if table.name == SchemaVersion.__tablename__:
+            continue
+        parts.append(table.name)
+        for column in table.columns:
+            parts.append(f"{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}")
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+def get_stored_version():
+    """Read the schema version recorded in the database, or None if it is missing"""
+    try:
+        return db.session.execute(
+            select(SchemaVersion.version).limit(1)
+        ).scalar()
+    except SQLAlchemyError as e:
+        # Table does not exist yet on a fresh database
+        logger.info(f"No schema version recorded: {str(e).splitlines()[0]}")
+        db.session.rollback()
+        return None
+
+def _column_signature(column, dialect):
+    """Comparable (nullable, type) pair for a model or reflected column"""
+    return column['nullable'], column['type'].compile(dialect=dialect)
+
+def find_schema_drift():
+    """List differences between the model tables and the live database tables"""
+    inspector = inspect(db.engine)
+    dialect = db.engine.dialect
+    existing = set(inspector.get_table_names())
+    problems = []
+    for table in db.metadata.tables.values():
+        if table.name not in existing:
+            problems.append(f"{table.name}: table is missing")
+            continue
+        live = {c['name']: _column_signature(c, dialect) for c in inspector.get_columns(table.name)}
+        expected = {
+            c.name: _column_signature({'nullable': c.nullable, 'type': c.type}, dialect)
+            for c in table.columns
+        }
+        for name in sorted(expected.keys() - live.keys()):
+            problems.append(f"{table.name}.{name}: column is missing")
+        for name in sorted(live.keys() - expected.keys()):
+            problems.append(f"{table.name}.{name}: column is not in the models")
+        for name in sorted(expected.keys() & live.keys()):
+            if expected[name] != live[name]:
+                problems.append(
+                    f"{table.name}.{name}: expected (nullable, type) {expected[name]}, found {live[name]}"
+                )
+    return problems
+
+def ensure_schema():
+    """Check the recorded schema version, creating missing tables only when it differs.
+
+    The one-row schema_version table is the cache: a matching version costs a
+    single query. On a mismatch, missing tables are created and the live columns
+    are compared with the models before the new version is recorded.
+    """
+    expected = schema_fingerprint()
+    if get_stored_version() == expected:
+        logger.info("Database schema is up to date")
+        return False
+
+    logger.info("Database schema version differs from the models, creating missing tables and checking columns")
+    db.create_all()
+    problems = find_schema_drift()
+    if problems:
+        raise RuntimeError(
+            "Database schema does not match the models; run a migration before starting:\n  "
+            + "\n  ".join(problems)
+        )
+
+    db.session.query(SchemaVersion).delete()
+    db.session.add(SchemaVersion(version=expected))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another worker recorded the same version first
+        db.session.rollback()
+    return True
@@ -0,0 +1,136 @@
+"""Startup profiler and cold-start benchmark.
+
+Usage (from the project root, with DATABASE_URL set):
+
+    python -m utils.startup_profile                 # imports and phases, both modes
+    python -m utils.startup_profile --benchmark 5   # also time to first served request
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ('full', 'fast')
+
+# Child process: build the app and print its phase timings as JSON
+PROFILE_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+application = app.create_app()
+timings = {'import_app': imported}
+timings.update(application.config['STARTUP_TIMINGS'])
+print(json.dumps(timings))
+"""
+
+# Child process: build the app and serve it on the given port
+SERVE_SNIPPET = """
+import sys
+from app import create_app
+create_app().run(host='127.0.0.1', port=int(sys.argv[1]), debug=False, use_reloader=False)
+"""
+
+def _child_env(mode):
+    env = dict(os.environ)
+    env['STARTUP_MODE'] = mode
+    return env
+
+def parse_importtime(stderr):
+    """Parse `python -X importtime` output into (module, self_us, cumulative_us) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, module = line[len('import time:'):].split('|', 2)
+            rows.append((module.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return rows
+
+def profile_startup(mode):
+    """Run create_app in a fresh interpreter and return (import rows, phase timings)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROFILE_SNIPPET],
+        cwd=PROJECT_ROOT, env=_child_env(mode), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup failed in {mode} mode:\n{result.stderr[-2000:]}")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    return parse_importtime(result.stderr), timings
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def time_to_first_request(mode, path='/', timeout=60.0):
+    """Seconds from spawning a server process until it answers its first request"""
+    port = _free_port()
+    url = f'http://127.0.0.1:{port}{path}'
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, '-c', SERVE_SNIPPET, str(port)],
+        cwd=PROJECT_ROOT, env=_child_env(mode),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server exited with code {proc.returncode} in {mode} mode")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    response.read()
+                return time.perf_counter() - start
+            except urllib.error.HTTPError:
+                # An error status is still a served response
+                return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise RuntimeError(f"No response from {url} within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+def print_profile(mode, rows, timings, top):
+    print(f"\n== {mode} mode ==")
+    print("Phases:")
+    for name, seconds in timings.items():
+        print(f"  {name:<12} {seconds * 1000:9.1f} ms")
+    print(f"Slowest imports (top {top} by cumulative time):")
+    for module, self_us, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:9.1f} ms  (self {self_us / 1000:7.1f} ms)  {module}")
+    loaded = {module for module, _, _ in rows}
+    print(f"pandas loaded at startup: {'yes' if 'pandas' in loaded else 'no'}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile application startup")
+    parser.add_argument('--mode', choices=MODES, action='append',
+                        help="startup mode to profile (default: both)")
+    parser.add_argument('--top', type=int, default=15, help="number of imports to list")
+    parser.add_argument('--benchmark', type=int, default=0, metavar='RUNS',
+                        help="also measure time to first served request over RUNS runs")
+    parser.add_argument('--path', default='/', help="path requested by the benchmark")
+    args = parser.parse_args(argv)
+
+    for mode in args.mode or MODES:
+        rows, timings = profile_startup(mode)
+        print_profile(mode, rows, timings, args.top)
+
+        if args.benchmark:
+            samples = sorted(time_to_first_request(mode, args.path) for _ in range(args.benchmark))
+            median = statistics.median(samples)
+            print(f"Time to first request ({args.benchmark} runs): "
+                  f"min {samples[0] * 1000:.1f} ms, median {median * 1000:.1f} ms, "
+                  f"max {samples[-1] * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()